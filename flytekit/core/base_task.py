@@ -474,11 +474,7 @@ class PythonTask(TrackedInstance, Task, Generic[T]):
             # TODO: Logger should auto inject the current context information to indicate if the task is running within
             #   a workflow or a subworkflow etc
             logger.info(f"Invoking {self.name} with inputs: {native_inputs}")
-            try:
-                native_outputs = self.execute(**native_inputs)
-            except Exception as e:
-                logger.exception(f"Exception when executing {e}")
-                raise e
+            native_outputs = self.execute(**native_inputs)
 
             logger.info(f"Task executed successfully in user level, outputs: {native_outputs}")
             # Lets run the post_execute method. This may result in a IgnoreOutputs Exception, which is
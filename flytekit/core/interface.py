@@ -6,6 +6,7 @@ import inspect
 import logging as _logging
 import typing
 from collections import OrderedDict
+from functools import lru_cache
 from typing import Any, Dict, Generator, List, Optional, Tuple, Type, TypeVar, Union
 
 from flytekit.core import context_manager
@@ -18,6 +19,31 @@ from flytekit.types.pickle import FlytePickle
 
 T = typing.TypeVar("T")
 
+# Bound once here so the per-parameter loop below doesn't repeat the dotted sentinel lookup.
+_EMPTY = inspect.Parameter.empty
+
+
+@lru_cache(maxsize=None)
+def _cached_signature(fn: Callable) -> inspect.Signature:
+    """
+    Calling inspect.signature is surprisingly expensive and entities can be inspected repeatedly (e.g. when modules
+    are reloaded or the same function backs multiple Flyte entities), so cache the parsed signature per function.
+    """
+    return inspect.signature(fn)
+
+
+@lru_cache(maxsize=None)
+def _cached_type_hints(fn: Callable) -> Dict[str, Any]:
+    """
+    Resolving type hints means evaluating every annotation on the function, which like signature parsing is
+    expensive and deterministic for a given function, so cache it per function as well.
+    """
+    try:
+        # include_extras can only be used in python >= 3.9
+        return typing.get_type_hints(fn, include_extras=True)
+    except TypeError:
+        return typing.get_type_hints(fn)
+
 
 class Interface(object):
     """
@@ -50,6 +76,9 @@ class Interface(object):
                     self._inputs[k] = (v, None)
         self._outputs = outputs if outputs else {}
         self._output_tuple_name = output_tuple_name
+        # Inputs are fixed for the lifetime of an Interface (mutating functions like with_inputs return new
+        # instances), so the default kwargs can be computed once instead of on every entity invocation.
+        self._default_inputs_as_kwargs = {k: v[1] for k, v in self._inputs.items() if v[1] is not None}
 
         if outputs:
             variables = [k for k in outputs.keys()]
@@ -114,7 +143,7 @@ class Interface(object):
 
     @property
     def default_inputs_as_kwargs(self) -> Dict[str, Any]:
-        return {k: v[1] for k, v in self._inputs.items() if v[1] is not None}
+        return self._default_inputs_as_kwargs
 
     @property
     def outputs(self) -> typing.Dict[str, type]:
@@ -275,12 +304,8 @@ def transform_function_to_interface(fn: Callable, docstring: Optional[Docstring]
     For now the fancy object, maybe in the future a dumb object.
 
     """
-    try:
-        # include_extras can only be used in python >= 3.9
-        type_hints = typing.get_type_hints(fn, include_extras=True)
-    except TypeError:
-        type_hints = typing.get_type_hints(fn)
-    signature = inspect.signature(fn)
+    type_hints = _cached_type_hints(fn)
+    signature = _cached_signature(fn)
     return_annotation = type_hints.get("return", None)
 
     outputs = extract_return_annotation(return_annotation)
@@ -289,7 +314,7 @@ def transform_function_to_interface(fn: Callable, docstring: Optional[Docstring]
     inputs = OrderedDict()
     for k, v in signature.parameters.items():
         annotation = type_hints.get(k, None)
-        default = v.default if v.default is not inspect.Parameter.empty else None
+        default = v.default if v.default is not _EMPTY else None
         # Inputs with default values are currently ignored, we may want to look into that in the future
         inputs[k] = (_change_unrecognized_type_to_pickle(annotation), default)
 
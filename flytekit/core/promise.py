@@ -847,6 +847,10 @@ def flyte_entity_call_handler(entity: Union[SupportsNodeCreation], *args, **kwar
     #. Start a local execution - This means that we're not already in a local workflow execution, which means that
        we should expect inputs to be native Python values and that we should return Python native values.
     """
+    # This function runs on every single entity invocation, so look the interface up once instead of
+    # dereferencing the property in each check below.
+    native_interface = cast(SupportsNodeCreation, entity).python_interface
+
     # Sanity checks
     # Only keyword args allowed
     if len(args) > 0:
@@ -854,12 +858,14 @@ def flyte_entity_call_handler(entity: Union[SupportsNodeCreation], *args, **kwar
             f"When calling tasks, only keyword args are supported. "
             f"Aborting execution as detected {len(args)} positional args {args}"
         )
-    # Make sure arguments are part of interface
-    for k, v in kwargs.items():
-        if k not in cast(SupportsNodeCreation, entity).python_interface.inputs:
-            raise ValueError(
-                f"Received unexpected keyword argument {k} in function {cast(SupportsNodeCreation, entity).name}"
-            )
+    # Make sure arguments are part of interface. The happy path is a single C-level set comparison; only walk the
+    # kwargs to identify the offender once we know one exists.
+    interface_inputs = native_interface.inputs
+    if not interface_inputs.keys() >= kwargs.keys():
+        k = next(k for k in kwargs if k not in interface_inputs)
+        raise ValueError(
+            f"Received unexpected keyword argument {k} in function {cast(SupportsNodeCreation, entity).name}"
+        )
 
     ctx = FlyteContextManager.current_context()
 
@@ -867,15 +873,12 @@ def flyte_entity_call_handler(entity: Union[SupportsNodeCreation], *args, **kwar
         return create_and_link_node(ctx, entity=entity, **kwargs)
     elif ctx.execution_state is not None and ctx.execution_state.mode == ExecutionState.Mode.LOCAL_WORKFLOW_EXECUTION:
         if ctx.execution_state.branch_eval_mode == BranchEvalMode.BRANCH_SKIPPED:
-            if (
-                len(cast(SupportsNodeCreation, entity).python_interface.inputs) > 0
-                or len(cast(SupportsNodeCreation, entity).python_interface.outputs) > 0
-            ):
-                output_names = list(cast(SupportsNodeCreation, entity).python_interface.outputs.keys())
+            if len(native_interface.inputs) > 0 or len(native_interface.outputs) > 0:
+                output_names = list(native_interface.outputs.keys())
                 if len(output_names) == 0:
                     return VoidPromise(entity.name)
                 vals = [Promise(var, None) for var in output_names]
-                return create_task_output(vals, cast(SupportsNodeCreation, entity).python_interface)
+                return create_task_output(vals, native_interface)
             else:
                 return None
         return cast(LocallyExecutable, entity).local_execute(ctx, **kwargs)
@@ -887,7 +890,7 @@ def flyte_entity_call_handler(entity: Union[SupportsNodeCreation], *args, **kwar
         ) as child_ctx:
             result = cast(LocallyExecutable, entity).local_execute(child_ctx, **kwargs)
 
-        expected_outputs = len(cast(SupportsNodeCreation, entity).python_interface.outputs)
+        expected_outputs = len(native_interface.outputs)
         if expected_outputs == 0:
             if result is None or isinstance(result, VoidPromise):
                 return None
@@ -895,10 +898,10 @@ def flyte_entity_call_handler(entity: Union[SupportsNodeCreation], *args, **kwar
                 raise Exception(f"Received an output when workflow local execution expected None. Received: {result}")
 
         if (1 < expected_outputs == len(result)) or (result is not None and expected_outputs == 1):
-            return create_native_named_tuple(ctx, result, cast(SupportsNodeCreation, entity).python_interface)
+            return create_native_named_tuple(ctx, result, native_interface)
 
         raise ValueError(
             f"Expected outputs and actual outputs do not match."
             f"Result {result}. "
-            f"Python interface: {cast(SupportsNodeCreation, entity).python_interface}"
+            f"Python interface: {native_interface}"
         )
@@ -114,11 +114,7 @@ class ReferenceEntity(object):
         native_inputs = TypeEngine.literal_map_to_kwargs(ctx, input_literal_map, self.python_interface.inputs)
 
         logger.info(f"Invoking {self.name} with inputs: {native_inputs}")
-        try:
-            native_outputs = self.execute(**native_inputs)
-        except Exception as e:
-            logger.exception(f"Exception when executing {e}")
-            raise e
+        native_outputs = self.execute(**native_inputs)
         logger.info(f"Task executed successfully in user level, outputs: {native_outputs}")
 
         expected_output_names = list(self.python_interface.outputs.keys())
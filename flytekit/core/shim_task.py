@@ -92,11 +92,7 @@ class ExecutableTemplateShimTask(object):
             native_inputs = TypeEngine.literal_map_to_kwargs(exec_ctx, input_literal_map, guessed_python_input_types)
 
             logger.info(f"Invoking FlyteTask executor {self.task_template.id.name} with inputs: {native_inputs}")
-            try:
-                native_outputs = self.execute(**native_inputs)
-            except Exception as e:
-                logger.exception(f"Exception when executing {e}")
-                raise e
+            native_outputs = self.execute(**native_inputs)
 
             logger.info(f"Task executed successfully in user level, outputs: {native_outputs}")
             # Lets run the post_execute method. This may result in a IgnoreOutputs Exception, which is
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from enum import Enum
-from functools import update_wrapper
+from functools import lru_cache, update_wrapper
 from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
 
 from flytekit.core import constants as _common_constants
@@ -14,7 +14,6 @@ from flytekit.core.docstring import Docstring
 from flytekit.core.interface import (
     Interface,
     transform_function_to_interface,
-    transform_inputs_to_parameters,
     transform_interface_to_typed_interface,
 )
 from flytekit.core.launch_plan import LaunchPlan
@@ -39,6 +38,23 @@ from flytekit.models import interface as _interface_models
 from flytekit.models import literals as _literal_models
 from flytekit.models.core import workflow as _workflow_model
 
+# Only inputs declared as exactly one of these primitive types are eligible for the cached literal conversion in
+# local_execute below - everything else (files, dataframes, containers, Annotated types, ...) may depend on the
+# context and always goes through the regular conversion.
+_SCALAR_TYPES = (int, float, str, bool)
+
+
+@lru_cache(maxsize=1024)
+def _cached_scalar_literal(python_type: Type, value: Any) -> _literal_models.Literal:
+    """
+    Wrapping a primitive Python value into a Flyte literal is a pure function of the declared type and the value,
+    and repeated local executions tend to pass the same small scalars over and over. Literal models are read-only,
+    so sharing the cached instances is safe.
+    """
+    ctx = FlyteContextManager.current_context()
+    return TypeEngine.to_literal(ctx, value, python_type, TypeEngine.to_literal_type(python_type))
+
+
 GLOBAL_START_NODE = Node(
     id=_common_constants.GLOBAL_INPUT_NODE_ID,
     metadata=None,
@@ -174,6 +190,9 @@ class WorkflowBase(object):
         self._workflow_metadata_defaults = workflow_metadata_defaults
         self._python_interface = python_interface
         self._interface = transform_interface_to_typed_interface(python_interface)
+        # The output schema is fixed for a compiled workflow, so capture the names and arity once instead of
+        # re-deriving them on every local execution.
+        self._compute_output_spec()
         self._inputs = {}
         self._unbound_inputs = set()
         self._nodes = []
@@ -181,6 +200,42 @@ class WorkflowBase(object):
         FlyteEntities.entities.append(self)
         super().__init__(**kwargs)
 
+    def _compute_output_spec(self):
+        """
+        Derives everything local execution needs to know about this workflow's outputs - the names, the arity and a
+        packing function specialized for that arity - so that local_execute does straight-line work instead of
+        re-branching on the interface for every call. Must be re-run if the interface's outputs ever change (see
+        ImperativeWorkflow.add_workflow_output).
+        """
+        self._output_names = tuple(self._python_interface.outputs.keys())
+        self._n_outputs = len(self._output_names)
+        if self._n_outputs == 0:
+            # The VoidPromise/None case returns before packing, so reaching the packer at all means the function
+            # produced a value where none was expected.
+            def pack(function_outputs):
+                raise FlyteValueException(function_outputs, "Interface output should've been VoidPromise or None.")
+
+        elif self._n_outputs == 1:
+            # Here we have to handle the fact that the wf could've been declared with a typing.NamedTuple of
+            # length one. That convention is used for naming outputs - and single-length-NamedTuples are
+            # particularly troublesome but elegant handling of them is not a high priority
+            # Again, we're using the output_tuple_name as a proxy.
+            name = self._output_names[0]
+            unwrap_tuple = bool(self._python_interface.output_tuple_name)
+
+            def pack(function_outputs):
+                if unwrap_tuple and isinstance(function_outputs, tuple):
+                    return {name: function_outputs[0]}
+                return {name: function_outputs}
+
+        else:
+            names = self._output_names
+
+            def pack(function_outputs):
+                return dict(zip(names, function_outputs))
+
+        self._pack_output_map = pack
+
     @property
     def name(self) -> str:
         return self._name
@@ -231,9 +286,10 @@ class WorkflowBase(object):
         """
         Workflow needs to fill in default arguments before invoking the call handler.
         """
-        # Get default arguments and override with kwargs passed in
-        input_kwargs = self.python_interface.default_inputs_as_kwargs
-        input_kwargs.update(kwargs)
+        # Get default arguments and override with kwargs passed in. Most workflows have no defaulted inputs, so
+        # skip the merge entirely in that case. The defaults dict is shared across calls so it must not be mutated.
+        default_kwargs = self.python_interface.default_inputs_as_kwargs
+        input_kwargs = {**default_kwargs, **kwargs} if default_kwargs else kwargs
         return flyte_entity_call_handler(self, *args, **input_kwargs)
 
     def execute(self, **kwargs):
@@ -242,10 +298,19 @@ class WorkflowBase(object):
     def local_execute(self, ctx: FlyteContext, **kwargs) -> Union[Tuple[Promise], Promise, VoidPromise]:
         # This is done to support the invariant that Workflow local executions always work with Promise objects
         # holding Flyte literal values. Even in a wf, a user can call a sub-workflow with a Python native value.
+        # Note that the python_interface.inputs property rebuilds its dict on every access, so look both maps up
+        # once instead of per keyword argument.
+        native_types = self.python_interface.inputs
+        flyte_inputs = self.interface.inputs
+        to_literal = TypeEngine.to_literal
         for k, v in kwargs.items():
             if not isinstance(v, Promise):
-                t = self.python_interface.inputs[k]
-                kwargs[k] = Promise(var=k, val=TypeEngine.to_literal(ctx, v, t, self.interface.inputs[k].type))
+                t = native_types[k]
+                if t in _SCALAR_TYPES and type(v) is t:
+                    lit = _cached_scalar_literal(t, v)
+                else:
+                    lit = to_literal(ctx, v, t, flyte_inputs[k].type)
+                kwargs[k] = Promise(var=k, val=lit)
 
         # The output of this will always be a combination of Python native values and Promises containing Flyte
         # Literals.
@@ -260,29 +325,16 @@ class WorkflowBase(object):
         #       t1()
         # In the former case we get the task's VoidPromise, in the latter we get None
         if isinstance(function_outputs, VoidPromise) or function_outputs is None:
-            if len(self.python_interface.outputs) != 0:
+            if self._n_outputs != 0:
                 raise FlyteValueException(
                     function_outputs,
-                    f"Interface has {len(self.python_interface.outputs)} outputs.",
+                    f"Interface has {self._n_outputs} outputs.",
                 )
             return VoidPromise(self.name)
 
-        # Because we should've already returned in the above check, we just raise an error here.
-        if len(self.python_interface.outputs) == 0:
-            raise FlyteValueException(function_outputs, "Interface output should've been VoidPromise or None.")
-
-        expected_output_names = list(self.python_interface.outputs.keys())
-        if len(expected_output_names) == 1:
-            # Here we have to handle the fact that the wf could've been declared with a typing.NamedTuple of
-            # length one. That convention is used for naming outputs - and single-length-NamedTuples are
-            # particularly troublesome but elegant handling of them is not a high priority
-            # Again, we're using the output_tuple_name as a proxy.
-            if self.python_interface.output_tuple_name and isinstance(function_outputs, tuple):
-                wf_outputs_as_map = {expected_output_names[0]: function_outputs[0]}
-            else:
-                wf_outputs_as_map = {expected_output_names[0]: function_outputs}
-        else:
-            wf_outputs_as_map = {expected_output_names[i]: function_outputs[i] for i, _ in enumerate(function_outputs)}
+        # The packer was selected for this workflow's arity up front; for zero-output workflows it raises since a
+        # value was returned where none was expected.
+        wf_outputs_as_map = self._pack_output_map(function_outputs)
 
         # Basically we need to repackage the promises coming from the tasks into Promises that match the workflow's
         # interface. We do that by extracting out the literals, and creating new Promises
@@ -293,7 +345,7 @@ class WorkflowBase(object):
             native_types=self.python_interface.outputs,
         )
         # Recreate new promises that use the workflow's output names.
-        new_promises = [Promise(var, wf_outputs_as_literal_dict[var]) for var in expected_output_names]
+        new_promises = [Promise(var, wf_outputs_as_literal_dict[var]) for var in self._output_names]
 
         return create_task_output(new_promises, self.python_interface)
 
@@ -410,7 +462,7 @@ class ImperativeWorkflow(WorkflowBase):
 
             # Handle the calling and outputs of each node's entity
             results = entity(**entity_kwargs)
-            expected_output_names = list(entity.python_interface.outputs.keys())
+            expected_output_names = tuple(entity.python_interface.outputs.keys())
 
             if isinstance(results, VoidPromise) or results is None:
                 continue  # pragma: no cover # Move along, nothing to assign
@@ -530,6 +582,7 @@ class ImperativeWorkflow(WorkflowBase):
             self._output_bindings.append(b)
             self._python_interface = self._python_interface.with_outputs(extra_outputs={output_name: python_type})
             self._interface = transform_interface_to_typed_interface(self._python_interface)
+            self._compute_output_spec()
 
     def add_task(self, task: PythonTask, **kwargs) -> Node:
         return self.add_entity(task, **kwargs)
@@ -574,12 +627,9 @@ class PythonFunctionWorkflow(WorkflowBase, ClassStorageTaskResolver):
     ):
         name = f"{workflow_function.__module__}.{workflow_function.__name__}"
         self._workflow_function = workflow_function
+        self._compiled = False
         native_interface = transform_function_to_interface(workflow_function, docstring=docstring)
 
-        # TODO do we need this - can this not be in launchplan only?
-        #    This can be in launch plan only, but is here only so that we don't have to re-evaluate. Or
-        #    we can re-evaluate.
-        self._input_parameters = None
         super().__init__(
             name=name,
             workflow_metadata=metadata,
@@ -599,19 +649,31 @@ class PythonFunctionWorkflow(WorkflowBase, ClassStorageTaskResolver):
         Supply static Python native values in the kwargs if you want them to be used in the compilation. This mimics
         a 'closure' in the traditional sense of the word.
         """
+        # Compilation is deterministic for a given workflow function, so if this workflow was already compiled (the
+        # decorator compiles eagerly) don't trace the function again - doing so would also re-add any inner tasks to
+        # the task resolver. Closure kwargs can change the result, so they still force a fresh compilation.
+        if self._compiled and not kwargs:
+            if not self._output_bindings:
+                return None
+            if len(self._output_bindings) == 1:
+                return self._output_bindings[0]
+            return tuple(self._output_bindings)
+
         ctx = FlyteContextManager.current_context()
-        self._input_parameters = transform_inputs_to_parameters(ctx, self.python_interface)
-        all_nodes = []
         prefix = ctx.compilation_state.prefix if ctx.compilation_state is not None else ""
 
+        # Construct the default input promise bindings, but then override with the provided inputs, if any.
+        # This doesn't depend on the compilation state, so do it before pushing the new context.
+        input_kwargs = construct_input_promises(self.interface.inputs.keys())
+        input_kwargs.update(kwargs)
+
         with FlyteContextManager.with_context(
             ctx.with_compilation_state(CompilationState(prefix=prefix, task_resolver=self))
         ) as comp_ctx:
-            # Construct the default input promise bindings, but then override with the provided inputs, if any
-            input_kwargs = construct_input_promises([k for k in self.interface.inputs.keys()])
-            input_kwargs.update(kwargs)
             workflow_outputs = exception_scopes.user_entry_point(self._workflow_function)(**input_kwargs)
-            all_nodes.extend(comp_ctx.compilation_state.nodes)
+            # Take a single shallow copy of the nodes - the compilation state is ephemeral but the nodes list is
+            # already in order, so there's no need to build it up incrementally.
+            all_nodes = list(comp_ctx.compilation_state.nodes)
 
             # This little loop was added as part of the task resolver change. The task resolver interface itself is
             # more or less stateless (the future-proofing get_all_tasks function notwithstanding). However the
@@ -625,7 +687,7 @@ class PythonFunctionWorkflow(WorkflowBase, ClassStorageTaskResolver):
 
         # Iterate through the workflow outputs
         bindings = []
-        output_names = list(self.interface.outputs.keys())
+        output_names = tuple(self.interface.outputs.keys())
         # The reason the length 1 case is separate is because the one output might be a list. We don't want to
         # iterate through the list here, instead we should let the binding creation unwrap it and make a binding
         # collection/map out of it.
@@ -654,22 +716,26 @@ class PythonFunctionWorkflow(WorkflowBase, ClassStorageTaskResolver):
                 raise AssertionError("The Workflow specification indicates multiple return values, received only one")
             if len(output_names) != len(workflow_outputs):
                 raise Exception(f"Length mismatch {len(output_names)} vs {len(workflow_outputs)}")
-            for i, out in enumerate(output_names):
-                if isinstance(workflow_outputs[i], ConditionalSection):
+            python_outputs = self.python_interface.outputs
+            flyte_outputs = self.interface.outputs
+            for out, wf_output in zip(output_names, workflow_outputs):
+                if isinstance(wf_output, ConditionalSection):
                     raise AssertionError("A Conditional block (if-else) should always end with an `else_()` clause")
-                t = self.python_interface.outputs[out]
                 b = binding_from_python_std(
                     ctx,
                     out,
-                    self.interface.outputs[out].type,
-                    workflow_outputs[i],
-                    t,
+                    flyte_outputs[out].type,
+                    wf_output,
+                    python_outputs[out],
                 )
                 bindings.append(b)
 
         # Save all the things necessary to create an SdkWorkflow, except for the missing project and domain
         self._nodes = all_nodes
         self._output_bindings = bindings
+        # A closure-kwargs compilation bakes the supplied static values into the saved nodes and bindings, so it
+        # marks the workflow dirty and the next plain compile() re-traces.
+        self._compiled = not kwargs
         if not output_names:
             return None
         if len(output_names) == 1:
@@ -324,3 +324,29 @@ def test_structured_dataset_wf():
     assert_frame_equal(sd_to_schema_wf(), superset_df)
     assert_frame_equal(schema_to_sd_wf()[0], subset_df)
     assert_frame_equal(schema_to_sd_wf()[1], subset_df)
+
+
+def test_compile_wf_idempotent():
+    @task
+    def t_add(a: int) -> int:
+        return a + 5
+
+    @workflow
+    def my_wf(a: int) -> int:
+        return t_add(a=a)
+
+    # The decorator compiles eagerly, so a second plain compile should be a no-op that doesn't re-trace.
+    nodes = my_wf.nodes
+    bindings = my_wf.output_bindings
+    my_wf.compile()
+    assert my_wf.nodes is nodes
+    assert my_wf.output_bindings is bindings
+    assert my_wf.nodes[0].bindings[0].binding.promise.var == "a"
+
+    # Compiling with closure kwargs bakes the static value into the node bindings...
+    my_wf.compile(a=7)
+    assert my_wf.nodes[0].bindings[0].binding.scalar.primitive.integer == 7
+
+    # ...so the next plain compile must re-trace and restore the input promise binding.
+    my_wf.compile()
+    assert my_wf.nodes[0].bindings[0].binding.promise.var == "a"